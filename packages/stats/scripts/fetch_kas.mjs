@@ -3,7 +3,9 @@
  * Fetch Kosovo ASKdata PxWeb series and save JSON outputs without Python.
  */
 
+import { createHash } from 'node:crypto';
 import fs from 'node:fs/promises';
+import os from 'node:os';
 import path from 'node:path';
 import process from 'node:process';
 import { pathToFileURL } from 'node:url';
@@ -34,22 +36,51 @@ const FUEL_SPECS = {
 
 const USER_AGENT = 'kas-pxweb-fetch/1.1 (kosovatools.org)';
 
+// Transient-failure retry policy shared by every PxWeb call: retry
+// rate-limits and server errors with exponential backoff, mirroring
+// urllib3's Retry(total=5, backoff_factor=0.5, status_forcelist=...).
+const RETRY_TOTAL = 5;
+const RETRY_BACKOFF_MS = 500;
+const RETRY_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
 export class PxError extends Error {}
 
-function jsonStringify(obj) {
-  return JSON.stringify(obj, (_key, value) => value ?? null, 2);
+export function jsonStringify(obj) {
+  // No replacer: the fetchers emit explicit nulls already, and a replacer
+  // costs one function call per scalar across the largest outputs. The
+  // trailing newline keeps the snapshots POSIX-friendly.
+  return `${JSON.stringify(obj, null, 2)}\n`;
 }
 
+// Strip NBSP and thousands separators in one pass; PxWeb's "no data"
+// sentinels map to null.
+const NUM_STRIP_RE = /[\u00a0,]/g;
+const NUM_SENTINELS = new Set(['.', '..', '...', '-']);
+
 export function coerceNumber(value) {
+  if (typeof value === 'number') return value;
   if (value === null || value === undefined) return null;
-  if (typeof value === 'number') return Number(value);
   const str = String(value).trim();
-  if (!str || ['.', '..', '...', '-'].includes(str)) return null;
-  const cleaned = str.replace(/\u00a0/g, '').replace(/,/g, '');
-  const num = Number(cleaned);
+  if (!str || NUM_SENTINELS.has(str)) return null;
+  const num = Number(str.replace(NUM_STRIP_RE, ''));
   return Number.isNaN(num) ? null : num;
 }
 
+export function coerceNumbers(values) {
+  const out = new Array(values.length);
+  for (let i = 0; i < values.length; i += 1) {
+    const v = values[i];
+    // Dense cubes are overwhelmingly plain numbers; skip the string
+    // machinery for those and only fall back to coerceNumber for the rest.
+    out[i] = typeof v === 'number' ? v : coerceNumber(v);
+  }
+  return out;
+}
+
 export function tidyNumber(value) {
   if (value === null || value === undefined) return null;
   if (Number.isInteger(Number(value))) return Number(value);
@@ -57,12 +88,37 @@ export function tidyNumber(value) {
   return Number.isNaN(num) ? null : num;
 }
 
-function slugifyLabel(text) {
-  const slug = text.toLowerCase().trim().replace(/[^0-9a-z]+/gi, '_').replace(/_+/g, '_').replace(/^_+|_+$/g, '');
-  return slug || 'value';
+// The normalize helpers are pure functions of a short label and get called
+// per cell or per loop iteration; memoizing collapses the repeated regex
+// and lowercase work into a Map hit. PxWeb tables carry a few dozen
+// distinct labels at most, so the caches stay tiny.
+function memoizeLabel(fn) {
+  const cache = new Map();
+  return (label) => {
+    let out = cache.get(label);
+    if (out === undefined) {
+      out = fn(label);
+      cache.set(label, out);
+    }
+    return out;
+  };
 }
 
-function normalizeFuelField(label) {
+const SLUG_NON_ALNUM_RE = /[^0-9a-z]+/gi;
+const SLUG_UNDERSCORE_RUN_RE = /_+/g;
+const SLUG_EDGE_UNDERSCORE_RE = /^_+|_+$/g;
+
+const slugifyLabel = memoizeLabel((text) => {
+  const slug = text
+    .toLowerCase()
+    .trim()
+    .replace(SLUG_NON_ALNUM_RE, '_')
+    .replace(SLUG_UNDERSCORE_RUN_RE, '_')
+    .replace(SLUG_EDGE_UNDERSCORE_RE, '');
+  return slug || 'value';
+});
+
+const normalizeFuelField = memoizeLabel((label) => {
   const l = label.toLowerCase();
   if (l.includes('ready') && l.includes('market')) return 'ready_for_market';
   if (l.includes('production')) return 'production';
@@ -70,30 +126,34 @@ function normalizeFuelField(label) {
   if (l.includes('export')) return 'export';
   if (l.includes('stock')) return 'stock';
   return slugifyLabel(label);
-}
+});
 
-function normalizeTourismMetric(label) {
+const normalizeTourismMetric = memoizeLabel((label) => {
   const l = label.toLowerCase();
   return l.includes('night') ? 'nights' : 'visitors';
-}
+});
 
-function normalizeGroupLabel(label) {
+const normalizeGroupLabel = memoizeLabel((label) => {
   const l = label.toLowerCase();
   if (l.startsWith('tot')) return 'total';
   if (l.startsWith('loc')) return 'local';
   if (l.startsWith('ext')) return 'external';
   return slugifyLabel(label);
-}
+});
+
+// Well-formed period codes ("202401", "2024M1", "2024-01") in one test.
+const YM_CODE_RE = /^(\d{4})(?:(\d{2})|M(\d{1,2})|-(\d{2}))$/;
 
 export function normalizeYM(code) {
-  if (/^\d{6}$/.test(code)) {
-    return `${code.slice(0, 4)}-${code.slice(4)}`;
+  const m = YM_CODE_RE.exec(code);
+  if (m) {
+    const month = m[2] ?? m[4] ?? m[3].padStart(2, '0');
+    return `${m[1]}-${month}`;
   }
   if (code.includes('M')) {
     const [year, month] = code.split('M', 2);
     return `${year}-${month.padStart(2, '0')}`;
   }
-  if (code.length === 7 && code[4] === '-') return code;
   return code;
 }
 
@@ -102,25 +162,63 @@ function apiJoin(base, parts, lang = 'en') {
   return segs.join('/');
 }
 
-async function requestJson(url, { method = 'GET', body, timeout = 30000 } = {}) {
+// HTTP/2 lets the concurrent fetchers multiplex over one TLS connection
+// instead of queueing on per-connection keep-alive. Node's bundled fetch is
+// HTTP/1.1-only, so opt in through undici's Agent when the package is
+// available; without it the global fetch (HTTP/1.1 keep-alive) is used.
+// This module-level client is the single shared "session": inspect_kas.mjs
+// reuses it (and its connection pool) by importing pxGetMeta/pxPostData
+// rather than opening its own connections.
+// KAS_NO_H2=1 forces the plain HTTP/1.1 client, the escape hatch for
+// middleboxes that negotiate h2 and then misbehave.
+const pxFetch = await (async () => {
+  if (process.env.KAS_NO_H2 !== '1') {
+    try {
+      const undici = await import('undici');
+      const dispatcher = new undici.Agent({ allowH2: true, connections: 16, keepAliveTimeout: 30000 });
+      return (url, opts) => undici.fetch(url, { ...opts, dispatcher });
+    } catch {
+      // undici not installed; global fetch below.
+    }
+  }
+  return fetch;
+})();
+
+// Default headers every PxWeb request carries; built once instead of per
+// call so the hot path only spreads per-request extras on top.
+const BASE_HEADERS = Object.freeze({
+  'User-Agent': USER_AGENT,
+  'Content-Type': 'application/json',
+  // Pin compression explicitly: JSON-stat cubes are multi-MB of
+  // repetitive numbers and compress ~10x; fetch decodes transparently
+  // (Node's fetch and undici both inflate gzip/deflate/brotli).
+  'Accept-Encoding': 'gzip, deflate, br',
+});
+
+async function requestJsonOnce(url, { method = 'GET', body, timeout = 30000, headers = null } = {}) {
   const controller = new AbortController();
   const timer = setTimeout(() => controller.abort(), timeout);
   try {
-    const res = await fetch(url, {
+    const res = await pxFetch(url, {
       method,
       signal: controller.signal,
-      headers: {
-        'User-Agent': USER_AGENT,
-        'Content-Type': 'application/json',
-      },
+      headers: headers ? { ...BASE_HEADERS, ...headers } : BASE_HEADERS,
       body: body ? JSON.stringify(body) : undefined,
     });
+    if (res.status === 304) {
+      return { ok: false, status: 304, statusText: res.statusText, notModified: true };
+    }
     const text = await res.text();
     if (!res.ok) {
-      return { ok: false, status: res.status, statusText: res.statusText, text };
+      return { ok: false, status: res.status, statusText: res.statusText, text, retryable: RETRY_STATUSES.has(res.status) };
     }
     try {
-      return { ok: true, json: text ? JSON.parse(text) : {} };
+      return {
+        ok: true,
+        json: text ? JSON.parse(text) : {},
+        etag: res.headers.get('etag'),
+        lastModified: res.headers.get('last-modified'),
+      };
     } catch (err) {
       return { ok: false, status: res.status, statusText: res.statusText, text: `invalid json: ${err}` };
     }
@@ -128,48 +226,273 @@ async function requestJson(url, { method = 'GET', body, timeout = 30000 } = {})
     if (err?.name === 'AbortError') {
       return { ok: false, statusText: 'timeout', text: 'Request timed out' };
     }
-    return { ok: false, statusText: err?.message ?? 'error', text: String(err) };
+    return { ok: false, statusText: err?.message ?? 'error', text: String(err), retryable: true };
   } finally {
     clearTimeout(timer);
   }
 }
 
-export async function pxGetMeta(parts, lang = 'en') {
+async function requestJson(url, options = {}) {
+  let result = null;
+  for (let attempt = 0; attempt <= RETRY_TOTAL; attempt += 1) {
+    if (attempt > 0) {
+      await sleep(RETRY_BACKOFF_MS * 2 ** (attempt - 1));
+    }
+    result = await requestJsonOnce(url, options);
+    if (result.ok || !result.retryable) break;
+  }
+  return result;
+}
+
+// KAS_HTTP_CACHE=1 turns repeated dev runs into disk reads: successful
+// data POSTs are cached for an hour keyed by method, URL and body, so
+// re-running the inspect script against unchanged tables skips the
+// network. Off by default — publishing runs should stay live. (GETs are
+// already covered by the validator-based meta cache below.)
+const HTTP_CACHE_ENABLED = process.env.KAS_HTTP_CACHE === '1';
+const HTTP_CACHE_DIR = path.join(os.homedir(), '.cache', 'kas-pxweb', 'http');
+const HTTP_CACHE_TTL_MS =
+  (Number.parseFloat(process.env.KAS_HTTP_CACHE_TTL_HOURS ?? '') || 1) * 60 * 60 * 1000;
+
+async function requestJsonCached(url, options = {}) {
+  if (!HTTP_CACHE_ENABLED) return requestJson(url, options);
+  const fingerprint = `${options.method ?? 'GET'} ${url} ${options.body ? JSON.stringify(options.body) : ''}`;
+  const file = path.join(HTTP_CACHE_DIR, `${createHash('sha1').update(fingerprint).digest('hex')}.json`);
+  try {
+    const entry = JSON.parse(await fs.readFile(file, 'utf8'));
+    if (Date.now() - entry.fetchedAt < HTTP_CACHE_TTL_MS) {
+      return { ok: true, json: entry.json };
+    }
+  } catch {
+    // Cache miss; fall through to the network.
+  }
+  const result = await requestJson(url, options);
+  if (result.ok) {
+    try {
+      await fs.mkdir(HTTP_CACHE_DIR, { recursive: true });
+      await fs.writeFile(file, JSON.stringify({ url, fetchedAt: Date.now(), json: result.json }), 'utf8');
+    } catch {
+      // Best-effort, same as the meta cache.
+    }
+  }
+  return result;
+}
+
+// Table metadata changes rarely (monthly at most), so cache it on disk and
+// revalidate with conditional GETs; a 304 turns the fetch into a header
+// exchange. Servers that send no validators fall back to a time-based TTL.
+// Both knobs are overridable for dev loops (KAS_META_CACHE_DIR to relocate,
+// KAS_META_TTL_HOURS to shorten or stretch the validator-less fallback).
+const META_CACHE_DIR =
+  process.env.KAS_META_CACHE_DIR || path.join(os.homedir(), '.cache', 'kas-pxweb', 'meta');
+const META_CACHE_TTL_MS =
+  (Number.parseFloat(process.env.KAS_META_TTL_HOURS ?? '') || 6) * 60 * 60 * 1000;
+
+async function readMetaCache(key) {
+  try {
+    return JSON.parse(await fs.readFile(path.join(META_CACHE_DIR, `${key}.json`), 'utf8'));
+  } catch {
+    return null;
+  }
+}
+
+async function writeMetaCache(key, entry) {
+  try {
+    await fs.mkdir(META_CACHE_DIR, { recursive: true });
+    await fs.writeFile(path.join(META_CACHE_DIR, `${key}.json`), JSON.stringify(entry), 'utf8');
+  } catch {
+    // Cache writes are best-effort; the fetch itself already succeeded.
+  }
+}
+
+// The fetchers and the inspector often ask for the same table meta several
+// times in one run (and, with the concurrent main(), sometimes at the same
+// moment). Memoize the in-flight promise per table+lang so each meta is
+// resolved once per process; the disk cache above still covers cross-run
+// reuse.
+const META_PROMISE_CACHE = new Map();
+
+export function pxGetMeta(parts, lang = 'en') {
+  const key = `${lang}:${parts.join('/')}`;
+  let promise = META_PROMISE_CACHE.get(key);
+  if (!promise) {
+    promise = pxGetMetaUncached(parts, lang);
+    // Drop failures so a transient error does not poison later retries.
+    promise.catch(() => META_PROMISE_CACHE.delete(key));
+    META_PROMISE_CACHE.set(key, promise);
+  }
+  return promise;
+}
+
+async function pxGetMetaUncached(parts, lang) {
   let lastErr = null;
   for (const base of API_BASES) {
     const url = apiJoin(base, parts, lang);
-    const result = await requestJson(url, { method: 'GET', timeout: 30000 });
-    if (result.ok) return result.json;
+    const cacheKey = createHash('sha1').update(url).digest('hex');
+    const cached = await readMetaCache(cacheKey);
+    if (cached && !cached.etag && !cached.lastModified && Date.now() - cached.fetchedAt < META_CACHE_TTL_MS) {
+      return cached.meta;
+    }
+    const headers = {};
+    if (cached?.etag) headers['If-None-Match'] = cached.etag;
+    if (cached?.lastModified) headers['If-Modified-Since'] = cached.lastModified;
+    const result = await requestJson(url, { method: 'GET', timeout: 30000, headers });
+    if (result.notModified && cached) {
+      return cached.meta;
+    }
+    if (result.ok) {
+      await writeMetaCache(cacheKey, {
+        url,
+        etag: result.etag ?? null,
+        lastModified: result.lastModified ?? null,
+        fetchedAt: Date.now(),
+        meta: result.json,
+      });
+      return result.json;
+    }
     lastErr = `GET ${url} -> ${result.status ?? ''} ${result.statusText ?? ''}`.trim();
   }
   throw new PxError(lastErr ?? 'Meta fetch failed');
 }
 
-export async function pxPostData(parts, body, lang = 'en') {
+// The closest useful form of request coalescing here: when two callers
+// issue byte-identical POSTs concurrently (fetch and inspect sharing a
+// process, or retries racing), they share one network request. Entries
+// are dropped as soon as the request settles, so this never serves stale
+// data within a run.
+const POST_INFLIGHT = new Map();
+
+export function pxPostData(parts, body, lang = 'en') {
+  const key = `${lang}:${parts.join('/')}:${JSON.stringify(body)}`;
+  let promise = POST_INFLIGHT.get(key);
+  if (!promise) {
+    promise = pxPostDataOnce(parts, body, lang);
+    promise.finally(() => POST_INFLIGHT.delete(key)).catch(() => {});
+    POST_INFLIGHT.set(key, promise);
+  }
+  return promise;
+}
+
+async function pxPostDataOnce(parts, body, lang) {
   let lastErr = null;
   const payload = { ...body };
   if (!payload.response) payload.response = { format: 'JSON' };
   for (const base of API_BASES) {
     const url = apiJoin(base, parts, lang);
-    const result = await requestJson(url, { method: 'POST', body: payload, timeout: 60000 });
+    const result = await requestJsonCached(url, { method: 'POST', body: payload, timeout: 60000 });
     if (result.ok) return result.json;
     lastErr = `POST ${url} -> ${result.status ?? ''} ${result.statusText ?? ''} ${(result.text ?? '').slice(0, 200)}`.trim();
-    if (result.status === 429) {
-      await new Promise((resolve) => setTimeout(resolve, 1000));
-    }
+  }
+  if (String(payload.response?.format ?? '').toLowerCase() === 'json-stat2') {
+    // Older PxWeb deployments only speak the row-oriented JSON format.
+    console.warn(`! json-stat2 rejected for ${parts[parts.length - 1]}; retrying with JSON`);
+    return pxPostData(parts, { ...body, response: { format: 'JSON' } }, lang);
   }
   throw new PxError(lastErr ?? 'Data fetch failed');
 }
 
+// PxWeb serializes big queries server-side and caps their size, so a
+// hundreds-of-partners selection is faster (and safer against 413s or
+// timeouts) as several smaller POSTs fetched in parallel. Splits the
+// selection for `chunkDim` into slices, fetches them concurrently, and
+// stitches the cubes back together in the original value order.
+async function pxPostDataChunked(parts, body, chunkDim, { chunkSize = 50, workers = 6 } = {}) {
+  const entry = (body.query ?? []).find((q) => q.code === chunkDim);
+  const codes = entry?.selection?.values;
+  if (!Array.isArray(codes) || codes.length <= chunkSize) {
+    return pxPostData(parts, body);
+  }
+  const slices = [];
+  for (let i = 0; i < codes.length; i += chunkSize) {
+    slices.push(codes.slice(i, i + chunkSize));
+  }
+  const cubes = new Array(slices.length);
+  await runLimited(
+    slices.map((slice, i) => async () => {
+      const query = body.query.map((q) =>
+        q === entry ? { ...q, selection: { ...q.selection, values: slice } } : q,
+      );
+      cubes[i] = await pxPostData(parts, { ...body, query });
+    }),
+    workers,
+  );
+  return mergeCubes(cubes, chunkDim);
+}
+
+function mergeCubes(cubes, chunkDim) {
+  if (cubes.every((c) => Array.isArray(c?.data))) {
+    // Row-oriented table format: rows carry their own keys, so the merge
+    // is a plain concatenation in chunk order.
+    return { ...cubes[0], data: cubes.flatMap((c) => c.data) };
+  }
+  if (!cubes.every((c) => Array.isArray(c?.value) && c.dimension && Array.isArray(c.id))) {
+    throw new PxError('Chunked fetch returned mixed response formats');
+  }
+  const first = cubes[0];
+  const axis = first.id.indexOf(chunkDim);
+  if (axis < 0) throw new PxError(`Chunked fetch: dimension ${chunkDim} missing from response`);
+  // Dense row-major layout factors as outer x chunkAxis x inner; each chunk
+  // contributes a contiguous inner-block per outer slice.
+  const inner = first.size.slice(axis + 1).reduce((a, b) => a * b, 1);
+  const outer = first.size.slice(0, axis).reduce((a, b) => a * b, 1);
+  const total = cubes.reduce((sum, c) => sum + c.size[axis], 0);
+  const values = new Array(outer * total * inner);
+  const index = {};
+  const label = {};
+  let offset = 0;
+  for (const cube of cubes) {
+    const size = cube.size[axis];
+    for (let o = 0; o < outer; o += 1) {
+      const src = o * size * inner;
+      const dst = (o * total + offset) * inner;
+      for (let k = 0; k < size * inner; k += 1) values[dst + k] = cube.value[src + k];
+    }
+    const category = cube.dimension[chunkDim]?.category ?? {};
+    for (const [code, ord] of Object.entries(category.index ?? {})) index[code] = ord + offset;
+    Object.assign(label, category.label ?? {});
+    offset += size;
+  }
+  const size = [...first.size];
+  size[axis] = total;
+  return {
+    ...first,
+    size,
+    value: values,
+    dimension: {
+      ...first.dimension,
+      [chunkDim]: { ...first.dimension[chunkDim], category: { index, label } },
+    },
+  };
+}
+
 function metaVariables(meta) {
-  return Array.isArray(meta?.variables) ? [...meta.variables] : [];
+  return Array.isArray(meta?.variables) ? meta.variables : [];
+}
+
+// Each fetcher resolves three or four dimensions plus their value maps from
+// the same meta document; index variables by code once per document instead
+// of rescanning the list on every lookup.
+const META_INDEX_CACHE = new WeakMap();
+
+function metaIndex(meta) {
+  let index = META_INDEX_CACHE.get(meta);
+  if (!index) {
+    index = new Map();
+    for (const v of metaVariables(meta)) {
+      index.set(String(v?.code ?? ''), v);
+    }
+    if (meta && typeof meta === 'object') META_INDEX_CACHE.set(meta, index);
+  }
+  return index;
 }
 
 function metaFindVar(meta, predicate) {
-  for (const v of metaVariables(meta)) {
+  for (const v of metaIndex(meta).values()) {
     const text = String(v?.text ?? '');
     const code = String(v?.code ?? '');
-    if (predicate(text, code, v)) return v;
+    // Lower once per variable; predicates take it as a fourth argument so
+    // multi-needle checks do not re-lower the same text.
+    if (predicate(text, code, v, text.toLowerCase())) return v;
   }
   return null;
 }
@@ -179,25 +502,117 @@ export function metaFindVarCode(meta, predicate) {
   return found?.code ?? null;
 }
 
+// Most dimension lookups are plain substring tests; taking needle lists
+// instead of per-call closures keeps the scan allocation-free and reuses
+// the prelowered text. A variable matches when any text needle occurs in
+// its label or any code needle occurs in its code.
+export function metaFindVarCodeAny(meta, textNeedles, codeNeedles = []) {
+  for (const v of metaIndex(meta).values()) {
+    const lower = String(v?.text ?? '').toLowerCase();
+    for (const needle of textNeedles) {
+      if (lower.includes(needle)) return String(v?.code ?? '');
+    }
+    if (codeNeedles.length) {
+      const codeLower = String(v?.code ?? '').toLowerCase();
+      for (const needle of codeNeedles) {
+        if (codeLower.includes(needle)) return String(v?.code ?? '');
+      }
+    }
+  }
+  return null;
+}
+
+// The time dimension test needs the variable object (PxWeb's time flag),
+// so it stays predicate-based — but as one shared predicate instead of an
+// inline closure per call site.
+const TIME_PREDICATE = (text, code, v, lower) =>
+  v.time === true || (lower.includes('year') && lower.includes('month'));
+
+export function metaFindTimeCode(meta) {
+  return metaFindVarCode(meta, TIME_PREDICATE);
+}
+
+// The (code, text) pair list for a dimension is requested several times per
+// run (fetcher plus inspector, sometimes twice within one fetcher); cache it
+// per variable object so the stringified pairs are built once.
+const VALUE_MAP_CACHE = new WeakMap();
+
 export function metaValueMap(meta, varCode) {
-  const variable = metaVariables(meta).find((v) => v?.code === varCode);
+  const variable = metaIndex(meta).get(String(varCode));
   if (!variable) return [];
-  const values = Array.isArray(variable.values) ? variable.values : [];
-  let texts = Array.isArray(variable.valueTexts) ? variable.valueTexts : [];
-  if (!texts.length || texts.length !== values.length) {
-    texts = values.map((c) => String(c));
+  let pairs = VALUE_MAP_CACHE.get(variable);
+  if (!pairs) {
+    const values = Array.isArray(variable.values) ? variable.values : [];
+    let texts = Array.isArray(variable.valueTexts) ? variable.valueTexts : [];
+    if (!texts.length || texts.length !== values.length) {
+      texts = values.map((c) => String(c));
+    }
+    pairs = values.map((value, index) => [String(value), String(texts[index] ?? value)]);
+    VALUE_MAP_CACHE.set(variable, pairs);
   }
-  return values.map((value, index) => [String(value), String(texts[index] ?? value)]);
+  return pairs;
 }
 
 export function metaTimeCodes(meta, timeCode) {
-  const variable = metaVariables(meta).find((v) => v?.code === timeCode);
+  const variable = metaIndex(meta).get(String(timeCode));
   if (!variable) return [];
   const values = Array.isArray(variable.values) ? [...variable.values] : [];
   if (variable.time === true) values.reverse();
   return values.map((v) => String(v));
 }
 
+// Resolve several value codes from (code, label) pairs in a single pass.
+// Each matcher is an ordered list of predicates over the lowercased label;
+// earlier predicates outrank later ones, and the first pair winning a given
+// rank keeps it. Replaces the repeated scan-with-fallback loops that
+// lowercased every label once per scan.
+function findCodes(pairs, matchers) {
+  const entries = Object.entries(matchers);
+  const out = {};
+  const rank = {};
+  for (const [name] of entries) {
+    out[name] = null;
+    rank[name] = Number.POSITIVE_INFINITY;
+  }
+  for (const [code, text] of pairs) {
+    const t = text.toLowerCase();
+    for (const [name, predicates] of entries) {
+      const limit = Math.min(rank[name], predicates.length);
+      for (let i = 0; i < limit; i += 1) {
+        if (predicates[i](t)) {
+          out[name] = code;
+          rank[name] = i;
+          break;
+        }
+      }
+    }
+  }
+  return out;
+}
+
+function jsonStatCube(cube) {
+  if (!Array.isArray(cube?.value) || !cube?.dimension || !Array.isArray(cube?.id) || !Array.isArray(cube?.size)) {
+    return null;
+  }
+  const order = cube.id.map((c) => String(c));
+  const sizes = cube.size;
+  const strides = Array(order.length).fill(1);
+  for (let i = sizes.length - 2; i >= 0; i -= 1) {
+    strides[i] = strides[i + 1] * sizes[i + 1];
+  }
+  // Coerce the flat value array once up front, into unboxed doubles so the
+  // largest cubes don't hold a second object array alongside the parsed
+  // response; NaN marks missing cells and reads back as null via tidyNumber.
+  const raw = cube.value;
+  const values = new Float64Array(raw.length);
+  for (let i = 0; i < raw.length; i += 1) {
+    const v = raw[i];
+    values[i] = typeof v === 'number' ? v : (coerceNumber(v) ?? Number.NaN);
+  }
+  const categoryIndex = (dimCode) => cube.dimension[dimCode]?.category?.index ?? {};
+  return { order, sizes, strides, values, categoryIndex };
+}
+
 function tableLookup(cube, dimOrder = null) {
   const dataRows = Array.isArray(cube?.data) ? cube.data : null;
   if (!dataRows?.length) return null;
@@ -210,9 +625,12 @@ function tableLookup(cube, dimOrder = null) {
   } else {
     return null;
   }
-  const lookup = new Map();
+  // First pass: assign each distinct dimension value an ordinal in observed
+  // order and keep the usable rows.
+  const ordinals = dimCodes.map(() => new Map());
+  const rows = [];
   for (const row of dataRows) {
-    const keyVals = Array.isArray(row?.key) ? row.key.map((v) => String(v)) : [];
+    const keyVals = Array.isArray(row?.key) ? row.key : [];
     if (keyVals.length !== dimCodes.length) continue;
     let value = null;
     if (Array.isArray(row?.values)) {
@@ -221,18 +639,61 @@ function tableLookup(cube, dimOrder = null) {
     } else if (Object.prototype.hasOwnProperty.call(row ?? {}, 'value')) {
       value = row.value;
     }
-    lookup.set(JSON.stringify(keyVals), coerceNumber(value));
+    for (let i = 0; i < keyVals.length; i += 1) {
+      const dimValue = String(keyVals[i]);
+      const ords = ordinals[i];
+      if (!ords.has(dimValue)) ords.set(dimValue, ords.size);
+    }
+    rows.push([keyVals, value]);
   }
-  return { dimCodes, lookup };
+  // Second pass: fill a dense typed array addressed by ordinal strides.
+  // Table responses are full cross products, so this stores one float per
+  // cell instead of a Map entry per row; NaN marks missing cells.
+  const strides = Array(dimCodes.length).fill(1);
+  for (let i = dimCodes.length - 2; i >= 0; i -= 1) {
+    strides[i] = strides[i + 1] * ordinals[i + 1].size;
+  }
+  const total = dimCodes.length ? strides[0] * ordinals[0].size : 0;
+  const values = new Float64Array(total).fill(Number.NaN);
+  for (const [keyVals, value] of rows) {
+    let idx = 0;
+    for (let i = 0; i < keyVals.length; i += 1) {
+      idx += ordinals[i].get(String(keyVals[i])) * strides[i];
+    }
+    values[idx] = coerceNumber(value) ?? Number.NaN;
+  }
+  return { dimCodes, lookup: { ordinals, strides, values } };
 }
 
 function lookupTableValue(dimCodes, lookup, assignments) {
-  const key = dimCodes.map((dim) => {
-    const val = assignments?.[dim];
-    return val === undefined || val === null ? null : String(val);
-  });
-  if (key.some((v) => v === null)) return null;
-  return lookup.get(JSON.stringify(key)) ?? null;
+  const { ordinals, strides, values } = lookup;
+  let idx = 0;
+  for (let i = 0; i < dimCodes.length; i += 1) {
+    const val = assignments?.[dimCodes[i]];
+    if (val === undefined || val === null) return null;
+    const ord = ordinals[i].get(String(val));
+    if (ord === undefined) return null;
+    idx += ord * strides[i];
+  }
+  const num = values[idx];
+  return Number.isNaN(num) ? null : num;
+}
+
+// Run task thunks with bounded parallelism (the fetch equivalent of a
+// worker pool): enough to overlap every source, capped so a pathological
+// retry storm cannot pile up unbounded sockets.
+const FETCH_CONCURRENCY = 8;
+
+async function runLimited(thunks, limit) {
+  let next = 0;
+  const worker = async () => {
+    while (next < thunks.length) {
+      const i = next;
+      next += 1;
+      await thunks[i]();
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, thunks.length) }, worker));
 }
 
 async function writeJson(outDir, name, data) {
@@ -247,32 +708,19 @@ async function fetchTradeMonthly(outDir, months) {
   const meta = await pxGetMeta(parts);
 
   const dimTime =
-    metaFindVarCode(meta, (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')))
+    metaFindTimeCode(meta)
     || 'Viti/muaji';
   const dimVar =
-    metaFindVarCode(meta, (text, code) => text.toLowerCase().includes('variable') || ['variabla', 'variables'].includes(code.toLowerCase()))
+    metaFindVarCodeAny(meta, ['variable'], ['variabla', 'variables'])
     || 'Variabla';
   if (!dimTime || !dimVar) {
     throw new PxError('Trade table: missing Year/month or Variables dimension');
   }
 
   const valPairs = metaValueMap(meta, dimVar);
-  let impCode = null;
-  for (const [code, text] of valPairs) {
-    if (text.toLowerCase().includes('imports') && text.toLowerCase().includes('cif')) {
-      impCode = code;
-      break;
-    }
-  }
-  if (!impCode) {
-    for (const [code, text] of valPairs) {
-      if (text.toLowerCase().includes('import')) {
-        impCode = code;
-        break;
-      }
-    }
-  }
-  if (!impCode) impCode = '3';
+  const impCode = findCodes(valPairs, {
+    imports: [(t) => t.includes('imports') && t.includes('cif'), (t) => t.includes('import')],
+  }).imports ?? '3';
 
   const allMonths = metaTimeCodes(meta, dimTime) ?? [];
   const pick = months ? allMonths.slice(-months) : allMonths;
@@ -288,7 +736,7 @@ async function fetchTradeMonthly(outDir, months) {
   const values = Array.isArray(data?.value) ? data.value : [];
   let coerced = [];
   if (values.length) {
-    coerced = values.map((v) => coerceNumber(v));
+    coerced = coerceNumbers(values);
   } else {
     const table = tableLookup(data, [dimTime, dimVar]);
     if (table) {
@@ -309,32 +757,22 @@ async function fetchEnergyMonthly(outDir, months) {
   const meta = await pxGetMeta(parts);
 
   const dimTime =
-    metaFindVarCode(meta, (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')))
+    metaFindTimeCode(meta)
     || 'Viti/muaji';
   const dimInd =
-    metaFindVarCode(meta, (text, code) =>
-      text.toLowerCase().includes('mwh') || text.toLowerCase().includes('indicator') || code.toLowerCase() === 'mwh') || 'MWH';
+    metaFindVarCodeAny(meta, ['mwh', 'indicator'], ['mwh']) || 'MWH';
   if (!dimTime || !dimInd) {
     throw new PxError('Energy table: missing Year/month or indicator (MWH) dimension');
   }
 
   const valPairs = metaValueMap(meta, dimInd);
-  let importCode = null;
-  let prodCode = null;
-  for (const [code, text] of valPairs) {
-    const t = text.toLowerCase();
-    if (!importCode && t.includes('import')) importCode = code;
-    if (!prodCode && (t.includes('gross production from power plants') || t.startsWith('gross production'))) prodCode = code;
-  }
-  if (!prodCode) {
-    for (const [code, text] of valPairs) {
-      const t = text.toLowerCase();
-      if (t.includes('gross') && t.includes('production')) {
-        prodCode = code;
-        break;
-      }
-    }
-  }
+  const { import: importCode, production: prodCode } = findCodes(valPairs, {
+    import: [(t) => t.includes('import')],
+    production: [
+      (t) => t.includes('gross production from power plants') || t.startsWith('gross production'),
+      (t) => t.includes('gross') && t.includes('production'),
+    ],
+  });
   if (!importCode || !prodCode) {
     throw new PxError("Energy table: could not find 'Import' and 'Gross Production from Power Plants' in indicator list");
   }
@@ -346,39 +784,29 @@ async function fetchEnergyMonthly(outDir, months) {
       { code: dimInd, selection: { filter: 'item', values: [importCode, prodCode] } },
       { code: dimTime, selection: { filter: 'item', values: pick } },
     ],
+    // json-stat2 sends one flat value array instead of a keyed row per
+    // cell; pxPostData falls back to JSON if the server rejects it.
+    response: { format: 'json-stat2' },
   };
   const cube = await pxPostData(parts, body);
   const series = [];
-  if (Array.isArray(cube?.value) && cube?.dimension) {
-    const order = cube.id;
-    const sizes = cube.size;
-    const strides = Array(order.length).fill(1);
-    for (let i = sizes.length - 2; i >= 0; i -= 1) {
-      strides[i] = strides[i + 1] * sizes[i + 1];
-    }
-    const idxTime = cube.dimension[dimTime].category.index;
-    const idxInd = cube.dimension[dimInd].category.index;
-    const impOrd = idxInd[importCode];
-    const prodOrd = idxInd[prodCode];
-    const pos = (coords) => coords.reduce((sum, c, idx) => sum + c * strides[idx], 0);
+  const stat = jsonStatCube(cube);
+  if (stat) {
+    const { order, strides, values } = stat;
+    const idxTime = stat.categoryIndex(dimTime);
+    const idxInd = stat.categoryIndex(dimInd);
+    // Axes other than indicator/time have a single selected member at
+    // ordinal 0, so each cell is just the sum of two stride terms.
+    const indStride = strides[order.indexOf(dimInd)];
+    const timeStride = strides[order.indexOf(dimTime)];
+    const impBase = idxInd[importCode] * indStride;
+    const prodBase = idxInd[prodCode] * indStride;
     for (const code of pick) {
-      const timeOrd = idxTime[code];
-      const coords = order.map((key) => {
-        if (key === dimInd) return impOrd;
-        if (key === dimTime) return timeOrd;
-        return 0;
-      });
-      const coordsProd = order.map((key) => {
-        if (key === dimInd) return prodOrd;
-        if (key === dimTime) return timeOrd;
-        return 0;
-      });
-      const importVal = coerceNumber(cube.value[pos(coords)]);
-      const prodVal = coerceNumber(cube.value[pos(coordsProd)]);
+      const timeOffset = idxTime[code] * timeStride;
       series.push({
         period: normalizeYM(code),
-        import_gwh: tidyNumber(importVal),
-        production_gwh: tidyNumber(prodVal),
+        import_gwh: tidyNumber(values[impBase + timeOffset]),
+        production_gwh: tidyNumber(values[prodBase + timeOffset]),
       });
     }
   } else {
@@ -404,7 +832,7 @@ async function fetchFuelTable(outDir, months, name, spec) {
   const label = spec.label ?? name;
   const meta = await pxGetMeta(parts);
   const dimTime =
-    metaFindVarCode(meta, (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')))
+    metaFindTimeCode(meta)
     || 'Viti/muaji';
   let measureDim = null;
   for (const variable of metaVariables(meta)) {
@@ -426,19 +854,39 @@ async function fetchFuelTable(outDir, months, name, spec) {
       { code: measureDim, selection: { filter: 'item', values: measureCodes } },
       { code: dimTime, selection: { filter: 'item', values: pick } },
     ],
+    response: { format: 'json-stat2' },
   };
   const cube = await pxPostData(parts, body);
-  const table = tableLookup(cube, [measureDim, dimTime]);
-  if (!table) throw new PxError(`${label}: unexpected response format`);
-  const { dimCodes, lookup } = table;
   const series = [];
-  for (const code of pick) {
-    const row = { period: normalizeYM(code) };
-    for (const measure of measureCodes) {
-      const value = lookupTableValue(dimCodes, lookup, { [measureDim]: measure, [dimTime]: code });
-      row[fieldMap[measure]] = tidyNumber(value);
+  const stat = jsonStatCube(cube);
+  if (stat) {
+    // Dense JSON-stat response: index the flat value array directly instead
+    // of building a throwaway table lookup.
+    const { order, strides, values } = stat;
+    const idxTime = stat.categoryIndex(dimTime);
+    const idxMeasure = stat.categoryIndex(measureDim);
+    const measureStride = strides[order.indexOf(measureDim)];
+    const timeStride = strides[order.indexOf(dimTime)];
+    for (const code of pick) {
+      const row = { period: normalizeYM(code) };
+      const timeOffset = idxTime[code] * timeStride;
+      for (const measure of measureCodes) {
+        row[fieldMap[measure]] = tidyNumber(values[idxMeasure[measure] * measureStride + timeOffset]);
+      }
+      series.push(row);
+    }
+  } else {
+    const table = tableLookup(cube, [measureDim, dimTime]);
+    if (!table) throw new PxError(`${label}: unexpected response format`);
+    const { dimCodes, lookup } = table;
+    for (const code of pick) {
+      const row = { period: normalizeYM(code) };
+      for (const measure of measureCodes) {
+        const value = lookupTableValue(dimCodes, lookup, { [measureDim]: measure, [dimTime]: code });
+        row[fieldMap[measure]] = tidyNumber(value);
+      }
+      series.push(row);
     }
-    series.push(row);
   }
   await writeJson(outDir, `kas_energy_${name}_monthly.json`, series);
   return {
@@ -454,22 +902,25 @@ async function fetchTourismRegion(outDir, months) {
   const parts = PATHS.tourism_region;
   const meta = await pxGetMeta(parts);
   const dimTime =
-    metaFindVarCode(meta, (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')))
+    metaFindTimeCode(meta)
     || 'Viti/muaji';
   const dimRegion =
-    metaFindVarCode(meta, (text) => text.toLowerCase().includes('region') || text.toLowerCase().includes('rajon')) || 'Rajonet';
+    metaFindVarCodeAny(meta, ['region', 'rajon']) || 'Rajonet';
   const dimOrigin =
-    metaFindVarCode(meta, (text) => text.toLowerCase().includes('local') || text.toLowerCase().includes('jasht'))
+    metaFindVarCodeAny(meta, ['local', 'jasht'])
     || 'Vendor/jashtem';
-  const dimVar = metaFindVarCode(meta, (text) => text.toLowerCase().includes('variable')) || 'Variabla';
+  const dimVar = metaFindVarCodeAny(meta, ['variable']) || 'Variabla';
 
   const regionPairs = metaValueMap(meta, dimRegion);
   const originPairs = metaValueMap(meta, dimOrigin);
+  // Invariant across the time loop; compute each origin's slug once.
+  const originSlugs = new Map(originPairs.map(([code, label]) => [code, normalizeGroupLabel(label)]));
   const varPairs = metaValueMap(meta, dimVar);
   const metricCodes = {};
   for (const [code, text] of varPairs) {
     metricCodes[normalizeTourismMetric(text)] = code;
   }
+  const metricEntries = Object.entries(metricCodes);
   const allMonths = metaTimeCodes(meta, dimTime) ?? [];
   const pick = months ? allMonths.slice(-months) : allMonths;
   const query = [
@@ -478,31 +929,66 @@ async function fetchTourismRegion(outDir, months) {
     { code: dimVar, selection: { filter: 'item', values: Object.values(metricCodes) } },
     { code: dimTime, selection: { filter: 'item', values: pick } },
   ];
-  const cube = await pxPostData(parts, { query, response: { format: 'JSON' } });
-  const table = tableLookup(cube, [dimTime, dimRegion, dimOrigin, dimVar]);
-  if (!table) throw new PxError('Tourism region: unexpected response format');
-  const { dimCodes, lookup } = table;
+  const cube = await pxPostData(parts, { query, response: { format: 'json-stat2' } });
   const records = [];
-  for (const timeCode of pick) {
-    const period = normalizeYM(timeCode);
-    for (const [regionCode, regionLabel] of regionPairs) {
-      for (const [originCode, originLabel] of originPairs) {
-        const row = {
-          period,
-          region: regionLabel,
-          visitor_group: normalizeGroupLabel(originLabel),
-          visitor_group_label: originLabel,
-        };
-        for (const [metricKey, metricCode] of Object.entries(metricCodes)) {
-          const value = lookupTableValue(dimCodes, lookup, {
-            [dimTime]: timeCode,
-            [dimRegion]: regionCode,
-            [dimOrigin]: originCode,
-            [dimVar]: metricCode,
-          });
-          row[metricKey] = tidyNumber(value);
+  const stat = jsonStatCube(cube);
+  if (stat) {
+    // Dense JSON-stat response: read cells straight out of the flat value
+    // array rather than materializing a table lookup first.
+    const { order, strides, values } = stat;
+    const idxTime = stat.categoryIndex(dimTime);
+    const idxRegion = stat.categoryIndex(dimRegion);
+    const idxOrigin = stat.categoryIndex(dimOrigin);
+    const idxVar = stat.categoryIndex(dimVar);
+    const timeStride = strides[order.indexOf(dimTime)];
+    const regionStride = strides[order.indexOf(dimRegion)];
+    const originStride = strides[order.indexOf(dimOrigin)];
+    const varStride = strides[order.indexOf(dimVar)];
+    for (const timeCode of pick) {
+      const period = normalizeYM(timeCode);
+      const timeOffset = idxTime[timeCode] * timeStride;
+      for (const [regionCode, regionLabel] of regionPairs) {
+        const regionOffset = timeOffset + idxRegion[regionCode] * regionStride;
+        for (const [originCode, originLabel] of originPairs) {
+          const originOffset = regionOffset + idxOrigin[originCode] * originStride;
+          const row = {
+            period,
+            region: regionLabel,
+            visitor_group: originSlugs.get(originCode),
+            visitor_group_label: originLabel,
+          };
+          for (const [metricKey, metricCode] of metricEntries) {
+            row[metricKey] = tidyNumber(values[originOffset + idxVar[metricCode] * varStride]);
+          }
+          records.push(row);
+        }
+      }
+    }
+  } else {
+    const table = tableLookup(cube, [dimTime, dimRegion, dimOrigin, dimVar]);
+    if (!table) throw new PxError('Tourism region: unexpected response format');
+    const { dimCodes, lookup } = table;
+    // One reusable assignments object: only the four slots change per cell.
+    const assignments = { [dimTime]: null, [dimRegion]: null, [dimOrigin]: null, [dimVar]: null };
+    for (const timeCode of pick) {
+      const period = normalizeYM(timeCode);
+      assignments[dimTime] = timeCode;
+      for (const [regionCode, regionLabel] of regionPairs) {
+        assignments[dimRegion] = regionCode;
+        for (const [originCode, originLabel] of originPairs) {
+          assignments[dimOrigin] = originCode;
+          const row = {
+            period,
+            region: regionLabel,
+            visitor_group: originSlugs.get(originCode),
+            visitor_group_label: originLabel,
+          };
+          for (const [metricKey, metricCode] of metricEntries) {
+            assignments[dimVar] = metricCode;
+            row[metricKey] = tidyNumber(lookupTableValue(dimCodes, lookup, assignments));
+          }
+          records.push(row);
         }
-        records.push(row);
       }
     }
   }
@@ -510,7 +996,7 @@ async function fetchTourismRegion(outDir, months) {
   return {
     periods: pick.length,
     regions: regionPairs.length,
-    visitor_groups: originPairs.map(([, label]) => normalizeGroupLabel(label)),
+    visitor_groups: [...originSlugs.values()],
     metrics: Object.keys(metricCodes),
     table: parts[parts.length - 1],
     path: parts.join('/'),
@@ -521,17 +1007,21 @@ async function fetchTourismCountry(outDir, months) {
   const parts = PATHS.tourism_country;
   const meta = await pxGetMeta(parts);
   const dimTime =
-    metaFindVarCode(meta, (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')))
+    metaFindTimeCode(meta)
     || 'Viti/muaji';
-  const dimVar = metaFindVarCode(meta, (text) => text.toLowerCase().includes('variable')) || 'Variabla';
+  const dimVar = metaFindVarCodeAny(meta, ['variable']) || 'Variabla';
   const dimCountry =
-    metaFindVarCode(meta, (text) => text.toLowerCase().includes('country') || text.toLowerCase().includes('shtetet')) || 'Shtetet';
+    metaFindVarCodeAny(meta, ['country', 'shtetet']) || 'Shtetet';
   const varPairs = metaValueMap(meta, dimVar);
   const metricCodes = {};
   for (const [code, text] of varPairs) {
     metricCodes[normalizeTourismMetric(text)] = code;
   }
+  const metricEntries = Object.entries(metricCodes);
   const countryPairs = metaValueMap(meta, dimCountry);
+  // The aggregate "External" row is skipped per period; filter it out once
+  // instead of lowercasing every label on every period iteration.
+  const outputPairs = countryPairs.filter(([, label]) => label.toLowerCase() !== 'external');
   const allMonths = metaTimeCodes(meta, dimTime) ?? [];
   const pick = months ? allMonths.slice(-months) : allMonths;
   const query = [
@@ -539,25 +1029,46 @@ async function fetchTourismCountry(outDir, months) {
     { code: dimCountry, selection: { filter: 'item', values: countryPairs.map(([code]) => code) } },
     { code: dimTime, selection: { filter: 'item', values: pick } },
   ];
-  const cube = await pxPostData(parts, { query, response: { format: 'JSON' } });
-  const table = tableLookup(cube, [dimTime, dimVar, dimCountry]);
-  if (!table) throw new PxError('Tourism country: unexpected response format');
-  const { dimCodes, lookup } = table;
+  const cube = await pxPostData(parts, { query, response: { format: 'json-stat2' } });
   const records = [];
-  for (const timeCode of pick) {
-    const period = normalizeYM(timeCode);
-    for (const [countryCode, countryLabel] of countryPairs) {
-      if (countryLabel.toLowerCase() === 'external') continue;
-      const row = { period, country: countryLabel };
-      for (const [metricKey, metricCode] of Object.entries(metricCodes)) {
-        const value = lookupTableValue(dimCodes, lookup, {
-          [dimTime]: timeCode,
-          [dimVar]: metricCode,
-          [dimCountry]: countryCode,
-        });
-        row[metricKey] = tidyNumber(value);
+  const stat = jsonStatCube(cube);
+  if (stat) {
+    const { order, strides, values } = stat;
+    const idxTime = stat.categoryIndex(dimTime);
+    const idxVar = stat.categoryIndex(dimVar);
+    const idxCountry = stat.categoryIndex(dimCountry);
+    const timeStride = strides[order.indexOf(dimTime)];
+    const varStride = strides[order.indexOf(dimVar)];
+    const countryStride = strides[order.indexOf(dimCountry)];
+    for (const timeCode of pick) {
+      const period = normalizeYM(timeCode);
+      const timeOffset = idxTime[timeCode] * timeStride;
+      for (const [countryCode, countryLabel] of outputPairs) {
+        const countryOffset = timeOffset + idxCountry[countryCode] * countryStride;
+        const row = { period, country: countryLabel };
+        for (const [metricKey, metricCode] of metricEntries) {
+          row[metricKey] = tidyNumber(values[countryOffset + idxVar[metricCode] * varStride]);
+        }
+        records.push(row);
+      }
+    }
+  } else {
+    const table = tableLookup(cube, [dimTime, dimVar, dimCountry]);
+    if (!table) throw new PxError('Tourism country: unexpected response format');
+    const { dimCodes, lookup } = table;
+    const assignments = { [dimTime]: null, [dimVar]: null, [dimCountry]: null };
+    for (const timeCode of pick) {
+      const period = normalizeYM(timeCode);
+      assignments[dimTime] = timeCode;
+      for (const [countryCode, countryLabel] of outputPairs) {
+        assignments[dimCountry] = countryCode;
+        const row = { period, country: countryLabel };
+        for (const [metricKey, metricCode] of metricEntries) {
+          assignments[dimVar] = metricCode;
+          row[metricKey] = tidyNumber(lookupTableValue(dimCodes, lookup, assignments));
+        }
+        records.push(row);
       }
-      records.push(row);
     }
   }
   await writeJson(outDir, 'kas_tourism_country_monthly.json', records);
@@ -570,38 +1081,52 @@ async function fetchTourismCountry(outDir, months) {
   };
 }
 
+// Resolve a --partners list (codes or labels, or the single token ALL)
+// against the table's partner pairs. Normalizes the wanted tokens once and
+// walks the pairs a single time, collecting codes and a code->label map;
+// shared with the inspect script so both filter identically.
+export function selectPartnerCodes(partnerPairs, partners) {
+  const codes = [];
+  const labels = {};
+  if (partners.length === 1 && partners[0].trim().toUpperCase() === 'ALL') {
+    for (const [code, label] of partnerPairs) {
+      codes.push(code);
+      labels[code] = label;
+    }
+    return { codes, labels };
+  }
+  const wanted = new Set();
+  for (const p of partners) {
+    const token = p.trim().toUpperCase();
+    if (token) wanted.add(token);
+  }
+  for (const [code, label] of partnerPairs) {
+    if (wanted.has(code.toUpperCase()) || wanted.has(String(label).toUpperCase())) {
+      codes.push(code);
+      labels[code] = label;
+    }
+  }
+  return { codes, labels };
+}
+
 async function fetchImportsByPartner(outDir, months, partners) {
   const parts = PATHS.imports_by_partner;
   const meta = await pxGetMeta(parts);
   const dimTime =
-    metaFindVarCode(meta, (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')))
+    metaFindTimeCode(meta)
     || 'Viti/muaji';
   const dimPartner =
-    metaFindVarCode(meta, (text, code) => text.toLowerCase().includes('partner') || code.toLowerCase().includes('partnerc'))
+    metaFindVarCodeAny(meta, ['partner'], ['partnerc'])
     || 'PartnerC';
-  const dimUnit = metaFindVarCode(meta, (text) => text.toLowerCase().includes('unit'));
+  const dimUnit = metaFindVarCodeAny(meta, ['unit']);
   if (!dimTime || !dimPartner) throw new PxError('Partner table: missing Year/month or Partner dimension');
   const allMonths = metaTimeCodes(meta, dimTime);
   const pick = months ? allMonths.slice(-months) : allMonths;
   const partnerPairs = metaValueMap(meta, dimPartner);
-  let partnerCodes;
-  let labelLookup = Object.fromEntries(partnerPairs);
-  if (partners.length === 1 && partners[0].toUpperCase() === 'ALL') {
-    partnerCodes = partnerPairs.map(([code]) => code);
-  } else {
-    const wanted = new Set(partners.map((p) => p.trim().toUpperCase()));
-    partnerCodes = [];
-    labelLookup = {};
-    for (const [code, label] of partnerPairs) {
-      if (wanted.has(code.toUpperCase()) || wanted.has(String(label).toUpperCase())) {
-        partnerCodes.push(code);
-        labelLookup[code] = label;
-      }
-    }
-    if (!partnerCodes.length) {
-      console.warn('! No partner codes matched; skipping partner download');
-      return { skipped: true };
-    }
+  const { codes: partnerCodes, labels: labelLookup } = selectPartnerCodes(partnerPairs, partners);
+  if (!partnerCodes.length) {
+    console.warn('! No partner codes matched; skipping partner download');
+    return { skipped: true };
   }
   const query = [
     { code: dimPartner, selection: { filter: 'item', values: partnerCodes } },
@@ -609,38 +1134,36 @@ async function fetchImportsByPartner(outDir, months, partners) {
   ];
   if (dimUnit) {
     const unitPairs = metaValueMap(meta, dimUnit);
-    const thou = unitPairs.find(([, text]) => String(text).includes('000') || String(text).toLowerCase().includes('thousand'));
-    if (thou) {
-      query.push({ code: dimUnit, selection: { filter: 'item', values: [thou[0]] } });
+    const { thousand } = findCodes(unitPairs, {
+      thousand: [(t) => t.includes('000') || t.includes('thousand')],
+    });
+    if (thousand) {
+      query.push({ code: dimUnit, selection: { filter: 'item', values: [thousand] } });
     }
   }
-  const cube = await pxPostData(parts, { query });
+  const cube = await pxPostDataChunked(
+    parts,
+    { query, response: { format: 'json-stat2' } },
+    dimPartner,
+  );
   const rows = [];
-  if (Array.isArray(cube?.value) && cube?.dimension) {
-    const order = cube.id;
-    const sizes = cube.size;
-    const strides = Array(order.length).fill(1);
-    for (let i = sizes.length - 2; i >= 0; i -= 1) {
-      strides[i] = strides[i + 1] * sizes[i + 1];
-    }
-    const idxTime = cube.dimension[dimTime].category.index;
-    const idxPartner = cube.dimension[dimPartner].category.index;
-    const pos = (coords) => coords.reduce((sum, c, idx) => sum + c * strides[idx], 0);
+  const stat = jsonStatCube(cube);
+  if (stat) {
+    const { order, strides, values } = stat;
+    const idxTime = stat.categoryIndex(dimTime);
+    const idxPartner = stat.categoryIndex(dimPartner);
+    // The unit axis (when present) has exactly one selected member at
+    // ordinal 0, so each cell reduces to partner + time stride terms.
+    const partnerStride = strides[order.indexOf(dimPartner)];
+    const timeStride = strides[order.indexOf(dimTime)];
     for (const partnerCode of partnerCodes) {
       const partnerLabel = labelLookup[partnerCode] ?? partnerCode;
-      const partnerOrd = idxPartner[partnerCode];
+      const partnerBase = idxPartner[partnerCode] * partnerStride;
       for (const timeCode of pick) {
-        const timeOrd = idxTime[timeCode];
-        const coords = order.map((key) => {
-          if (key === dimPartner) return partnerOrd;
-          if (key === dimTime) return timeOrd;
-          return 0;
-        });
-        const value = coerceNumber(cube.value[pos(coords)]);
         rows.push({
           period: normalizeYM(timeCode),
           partner: partnerLabel,
-          imports_th_eur: tidyNumber(value),
+          imports_th_eur: tidyNumber(values[partnerBase + idxTime[timeCode] * timeStride]),
         });
       }
     }
@@ -666,7 +1189,7 @@ async function fetchImportsByPartner(outDir, months, partners) {
 
 export async function main() {
   const argv = process.argv.slice(2);
-  const args = { months: null, out: null, all: false, partners: null, noPartners: false };
+  const args = { months: null, out: null, all: false, partners: null, noPartners: false, noFuel: false, noTourism: false };
   for (let i = 0; i < argv.length; i += 1) {
     const arg = argv[i];
     switch (arg) {
@@ -686,6 +1209,12 @@ export async function main() {
       case '--no-partners':
         args.noPartners = true;
         break;
+      case '--no-fuel':
+        args.noFuel = true;
+        break;
+      case '--no-tourism':
+        args.noTourism = true;
+        break;
       default:
         if (arg.startsWith('--')) {
           throw new PxError(`Unknown argument: ${arg}`);
@@ -707,36 +1236,69 @@ export async function main() {
 
   await fs.mkdir(outDir, { recursive: true });
   const started = new Date().toISOString();
-  const tradeInfo = await fetchTradeMonthly(outDir, months ?? undefined);
-  const energyInfo = await fetchEnergyMonthly(outDir, months ?? undefined);
+
+  // Every fetcher is an independent round trip to the same PxWeb host and
+  // writes its own output file, so run them all concurrently: total wall time
+  // becomes the slowest fetch instead of the sum of all of them.
+  let tradeInfo = null;
+  let energyInfo = null;
   const fuelInfos = {};
-  for (const [fuelName, spec] of Object.entries(FUEL_SPECS)) {
-    try {
-      fuelInfos[fuelName] = await fetchFuelTable(outDir, months ?? undefined, fuelName, spec);
-    } catch (error) {
-      console.warn(`! Fuel ${fuelName} download failed:`, error.message ?? error);
-    }
-  }
   let tourismRegionInfo = null;
   let tourismCountryInfo = null;
-  try {
-    tourismRegionInfo = await fetchTourismRegion(outDir, months ?? undefined);
-  } catch (error) {
-    console.warn('! Tourism region download failed:', error.message ?? error);
+  let partnerInfo = null;
+  const tasks = [
+    () => fetchTradeMonthly(outDir, months ?? undefined).then((info) => {
+      tradeInfo = info;
+    }),
+    () => fetchEnergyMonthly(outDir, months ?? undefined).then((info) => {
+      energyInfo = info;
+    }),
+  ];
+  if (!args.noFuel) {
+    // Each fuel table is a single POST covering every measure; the four
+    // tables share one folder and run concurrently, metas included.
+    for (const [fuelName, spec] of Object.entries(FUEL_SPECS)) {
+      tasks.push(() =>
+        fetchFuelTable(outDir, months ?? undefined, fuelName, spec)
+          .then((info) => {
+            fuelInfos[fuelName] = info;
+          })
+          .catch((error) => {
+            console.warn(`! Fuel ${fuelName} download failed:`, error.message ?? error);
+          }),
+      );
+    }
   }
-  try {
-    tourismCountryInfo = await fetchTourismCountry(outDir, months ?? undefined);
-  } catch (error) {
-    console.warn('! Tourism country download failed:', error.message ?? error);
+  if (!args.noTourism) {
+    tasks.push(
+      () => fetchTourismRegion(outDir, months ?? undefined)
+        .then((info) => {
+          tourismRegionInfo = info;
+        })
+        .catch((error) => {
+          console.warn('! Tourism region download failed:', error.message ?? error);
+        }),
+      () => fetchTourismCountry(outDir, months ?? undefined)
+        .then((info) => {
+          tourismCountryInfo = info;
+        })
+        .catch((error) => {
+          console.warn('! Tourism country download failed:', error.message ?? error);
+        }),
+    );
   }
-  let partnerInfo = null;
   if (partners) {
-    try {
-      partnerInfo = await fetchImportsByPartner(outDir, months ?? undefined, partners);
-    } catch (error) {
-      console.warn('! Partner download failed:', error.message ?? error);
-    }
+    tasks.push(() =>
+      fetchImportsByPartner(outDir, months ?? undefined, partners)
+        .then((info) => {
+          partnerInfo = info;
+        })
+        .catch((error) => {
+          console.warn('! Partner download failed:', error.message ?? error);
+        }),
+    );
   }
+  await runLimited(tasks, FETCH_CONCURRENCY);
   const fuelManifest = Object.keys(fuelInfos).length ? fuelInfos : null;
   const tourismManifest = {};
   if (tourismRegionInfo) tourismManifest.region = tourismRegionInfo;
@@ -792,6 +1354,8 @@ if (isDirectRun) {
 }
 
 export const __internal = {
+  jsonStatCube,
+  mergeCubes,
   tableLookup,
   lookupTableValue,
   tidyNumber,
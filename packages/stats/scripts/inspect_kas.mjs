@@ -4,6 +4,7 @@
  */
 
 import fs from 'node:fs/promises';
+import util from 'node:util';
 import path from 'node:path';
 import process from 'node:process';
 import { pathToFileURL } from 'node:url';
@@ -12,10 +13,13 @@ import {
   PATHS,
   pxGetMeta,
   pxPostData,
-  metaFindVarCode,
+  metaFindVarCodeAny,
+  metaFindTimeCode,
   metaValueMap,
   metaTimeCodes,
   normalizeYM,
+  jsonStringify,
+  selectPartnerCodes,
   PxError,
 } from './fetch_kas.mjs';
 
@@ -31,60 +35,105 @@ const TOURISM_TABLES = {
   tourism_country: ['ASKdata', 'Tourism and hotels', 'Treguesit mujorë', 'tab02.px'],
 };
 
-async function dumpJson(filePath, payload) {
-  await fs.mkdir(path.dirname(filePath), { recursive: true });
-  await fs.writeFile(filePath, JSON.stringify(payload, null, 2), 'utf8');
-  console.log(`wrote ${filePath}`);
+// Debug dumps ride in the background so the next network request is not
+// blocked on disk; main() awaits the backlog (and surfaces any failure)
+// before exiting.
+const pendingWrites = [];
+
+function dumpJson(filePath, payload) {
+  const write = (async () => {
+    await fs.mkdir(path.dirname(filePath), { recursive: true });
+    await fs.writeFile(filePath, jsonStringify(payload), 'utf8');
+    console.log(`wrote ${filePath}`);
+  })();
+  // Defuse the unhandled-rejection trap while the write waits in the
+  // queue; flushDumps still observes (and rethrows) the real failure.
+  write.catch(() => {});
+  pendingWrites.push(write);
+}
+
+async function flushDumps() {
+  await Promise.all(pendingWrites.splice(0));
+}
+
+// The debug previews only need a handful of cells; pull them from
+// whichever response shape came back (json-stat value array or
+// row-oriented data) without walking the rest of the payload.
+function previewValues(cube, count) {
+  if (Array.isArray(cube?.value)) return cube.value.slice(0, count);
+  if (Array.isArray(cube?.data)) return cube.data.slice(0, count).map((row) => row?.values?.[0]);
+  return [];
+}
+
+function cubeLength(cube) {
+  if (Array.isArray(cube?.value)) return cube.value.length;
+  if (Array.isArray(cube?.data)) return cube.data.length;
+  return 0;
+}
+
+// Inspections emit 10-20 lines interleaved with network awaits; buffering
+// per table and flushing once keeps each table's output contiguous (and
+// cuts per-line stdout flushes) when inspections overlap.
+function tableLog() {
+  const lines = [];
+  const log = (...args) => lines.push(util.format(...args));
+  log.flush = () => {
+    if (lines.length) process.stdout.write(`${lines.join('\n')}\n`);
+    lines.length = 0;
+  };
+  return log;
+}
+
+function buffered(fn) {
+  return async (...args) => {
+    const log = tableLog();
+    try {
+      return await fn(log, ...args);
+    } finally {
+      log.flush();
+    }
+  };
 }
 
 function findTimeDimension(meta) {
-  return (
-    metaFindVarCode(
-      meta,
-      (text, code, v) => v.time === true || (text.toLowerCase().includes('year') && text.toLowerCase().includes('month')),
-    ) || 'Viti/muaji'
-  );
+  return metaFindTimeCode(meta) || 'Viti/muaji';
 }
 
-async function inspectTrade(months, outDir, lang) {
+const inspectTrade = buffered(async (log, months, outDir, lang) => {
   const tag = 'trade_monthly';
   const parts = PATHS[tag];
-  console.log(`\n== ${tag} ==`);
+  log(`\n== ${tag} ==`);
   const meta = await pxGetMeta(parts, lang);
-  await dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
+  dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
 
   const dimTime = findTimeDimension(meta);
   const dimVar =
-    metaFindVarCode(meta, (text, code) => text.toLowerCase().includes('variable') || ['variabla', 'variables'].includes(code.toLowerCase()))
+    metaFindVarCodeAny(meta, ['variable'], ['variabla', 'variables'])
     || 'Variabla';
-  console.log('time dim:', dimTime);
-  console.log('var dim :', dimVar);
+  log('time dim:', dimTime);
+  log('var dim :', dimVar);
 
   const valPairs = metaValueMap(meta, dimVar);
-  console.log('available import indicators:');
-  for (const [code, text] of valPairs) {
-    if (text.toLowerCase().includes('import')) {
-      console.log(`  ${code}: ${text}`);
-    }
-  }
+  // One pass over the pairs covers both the listing and the code choice
+  // (CIF imports preferred, any import label as fallback).
   let impCode = null;
+  let impFallback = null;
+  log('available import indicators:');
   for (const [code, text] of valPairs) {
     const lower = text.toLowerCase();
-    if (lower.includes('imports') && lower.includes('cif')) {
-      impCode = code;
-      break;
-    }
-  }
-  if (!impCode) {
-    impCode = valPairs.find(([, text]) => text.toLowerCase().includes('import'))?.[0] ?? (valPairs[0]?.[0] ?? '3');
+    if (!lower.includes('import')) continue;
+    log(`  ${code}: ${text}`);
+    if (!impFallback) impFallback = code;
+    if (!impCode && lower.includes('imports') && lower.includes('cif')) impCode = code;
   }
-  console.log('chosen import code:', impCode);
+  if (!impCode) impCode = impFallback ?? valPairs[0]?.[0] ?? '3';
+  log('chosen import code:', impCode);
 
   const allMonths = metaTimeCodes(meta, dimTime);
   const pick = months ? allMonths.slice(-months) : allMonths;
-  console.log(`total months in table: ${allMonths.length}; picking ${pick.length}`);
+  log(`total months in table: ${allMonths.length}; picking ${pick.length}`);
   if (pick.length) {
-    console.log(`sample months: ${pick.slice(0, 3)} ... ${pick.slice(-3)}`);
+    log(`sample months: ${pick.slice(0, 3)} ... ${pick.slice(-3)}`);
   }
   const body = {
     query: [
@@ -93,56 +142,52 @@ async function inspectTrade(months, outDir, lang) {
     ],
     response: { format: 'JSON' },
   };
-  await dumpJson(path.join(outDir, `${tag}_body.json`), body);
+  dumpJson(path.join(outDir, `${tag}_body.json`), body);
   const cube = await pxPostData(parts, body, lang);
-  await dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
-  const values = Array.isArray(cube?.value) ? cube.value : [];
-  const preview = pick.slice(0, 5).map((code, idx) => [normalizeYM(code), values[idx]]);
-  console.log('preview period/value pairs:', preview);
-}
+  dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
+  const head = previewValues(cube, 5);
+  const preview = pick.slice(0, 5).map((code, idx) => [normalizeYM(code), head[idx]]);
+  log('preview period/value pairs:', preview);
+});
 
-async function inspectEnergy(months, outDir, lang) {
+const inspectEnergy = buffered(async (log, months, outDir, lang) => {
   const tag = 'energy_monthly';
   const parts = PATHS[tag];
-  console.log(`\n== ${tag} ==`);
+  log(`\n== ${tag} ==`);
   const meta = await pxGetMeta(parts, lang);
-  await dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
+  dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
 
   const dimTime = findTimeDimension(meta);
   const dimInd =
-    metaFindVarCode(
-      meta,
-      (text, code) => text.toLowerCase().includes('mwh') || text.toLowerCase().includes('indicator') || code.toLowerCase() === 'mwh',
-    ) || 'MWH';
-  console.log('time dim:', dimTime);
-  console.log('indicator dim:', dimInd);
+    metaFindVarCodeAny(meta, ['mwh', 'indicator'], ['mwh']) || 'MWH';
+  log('time dim:', dimTime);
+  log('indicator dim:', dimInd);
 
   const valPairs = metaValueMap(meta, dimInd);
-  console.log('available indicator labels containing import/gross:');
-  for (const [code, text] of valPairs) {
-    const lower = text.toLowerCase();
-    if (lower.includes('import') || lower.includes('gross')) {
-      console.log(`  ${code}: ${text}`);
-    }
-  }
+  // List and resolve the indicator codes in one traversal, lowercasing
+  // each label once.
   let importCode = null;
   let prodCode = null;
+  let prodFallback = null;
+  log('available indicator labels containing import/gross:');
   for (const [code, text] of valPairs) {
     const lower = text.toLowerCase();
+    if (lower.includes('import') || lower.includes('gross')) {
+      log(`  ${code}: ${text}`);
+    }
     if (!importCode && lower.includes('import')) importCode = code;
     if (!prodCode && (lower.includes('gross production from power plants') || lower.startsWith('gross production'))) prodCode = code;
+    if (!prodFallback && lower.includes('gross') && lower.includes('production')) prodFallback = code;
   }
-  if (!prodCode) {
-    prodCode = valPairs.find(([, text]) => text.toLowerCase().includes('gross') && text.toLowerCase().includes('production'))?.[0] ?? null;
-  }
-  console.log('chosen import code:', importCode);
-  console.log('chosen production code:', prodCode);
+  if (!prodCode) prodCode = prodFallback;
+  log('chosen import code:', importCode);
+  log('chosen production code:', prodCode);
 
   const allMonths = metaTimeCodes(meta, dimTime);
   const pick = months ? allMonths.slice(-months) : allMonths;
-  console.log(`total months in table: ${allMonths.length}; picking ${pick.length}`);
+  log(`total months in table: ${allMonths.length}; picking ${pick.length}`);
   if (pick.length) {
-    console.log(`sample months: ${pick.slice(0, 3)} ... ${pick.slice(-3)}`);
+    log(`sample months: ${pick.slice(0, 3)} ... ${pick.slice(-3)}`);
   }
   const body = {
     query: [
@@ -151,43 +196,35 @@ async function inspectEnergy(months, outDir, lang) {
     ],
     response: { format: 'JSON' },
   };
-  await dumpJson(path.join(outDir, `${tag}_body.json`), body);
+  dumpJson(path.join(outDir, `${tag}_body.json`), body);
   const cube = await pxPostData(parts, body, lang);
-  await dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
-  const values = Array.isArray(cube?.value) ? cube.value : [];
-  console.log('total raw values:', values.length);
-  if (values.length) {
-    console.log('first values:', values.slice(0, 10));
+  dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
+  log('total raw values:', cubeLength(cube));
+  const head = previewValues(cube, 10);
+  if (head.length) {
+    log('first values:', head);
   }
-}
+});
 
-async function inspectPartners(months, outDir, lang, partners) {
+const inspectPartners = buffered(async (log, months, outDir, lang, partners) => {
   const tag = 'imports_by_partner';
   const parts = PATHS[tag];
-  console.log(`\n== ${tag} ==`);
+  log(`\n== ${tag} ==`);
   const meta = await pxGetMeta(parts, lang);
-  await dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
+  dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
 
   const dimTime = findTimeDimension(meta);
   const dimPartner =
-    metaFindVarCode(meta, (text, code) => text.toLowerCase().includes('partner') || code.toLowerCase().includes('partnerc')) || 'PartnerC';
-  const dimUnit = metaFindVarCode(meta, (text) => text.toLowerCase().includes('unit'));
-  console.log('time dim:', dimTime);
-  console.log('partner dim:', dimPartner);
-  if (dimUnit) console.log('unit dim:', dimUnit);
+    metaFindVarCodeAny(meta, ['partner'], ['partnerc']) || 'PartnerC';
+  const dimUnit = metaFindVarCodeAny(meta, ['unit']);
+  log('time dim:', dimTime);
+  log('partner dim:', dimPartner);
+  if (dimUnit) log('unit dim:', dimUnit);
 
   const allMonths = metaTimeCodes(meta, dimTime);
   const pick = months ? allMonths.slice(-months) : allMonths;
   const partnerPairs = metaValueMap(meta, dimPartner);
-  let partnerCodes;
-  if (partners.length === 1 && partners[0].toUpperCase() === 'ALL') {
-    partnerCodes = partnerPairs.map(([code]) => code);
-  } else {
-    const wanted = new Set(partners.map((p) => p.trim().toUpperCase()));
-    partnerCodes = partnerPairs
-      .filter(([code, label]) => wanted.has(code.toUpperCase()) || wanted.has(String(label).toUpperCase()))
-      .map(([code]) => code);
-  }
+  const { codes: partnerCodes } = selectPartnerCodes(partnerPairs, partners);
   if (!partnerCodes.length) {
     console.warn('! No partner codes matched; skipping request');
     return;
@@ -204,19 +241,18 @@ async function inspectPartners(months, outDir, lang, partners) {
     }
   }
   const body = { query, response: { format: 'JSON' } };
-  await dumpJson(path.join(outDir, `${tag}_body.json`), body);
+  dumpJson(path.join(outDir, `${tag}_body.json`), body);
   const cube = await pxPostData(parts, body, lang);
-  await dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
-  const values = Array.isArray(cube?.value) ? cube.value : [];
-  console.log('first values:', values.slice(0, 10));
-}
+  dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
+  log('first values:', previewValues(cube, 10));
+});
 
-async function inspectFuel(kind, months, outDir, lang) {
+const inspectFuel = buffered(async (log, kind, months, outDir, lang) => {
   const parts = FUEL_TABLES[kind];
   if (!parts) throw new PxError(`Unknown fuel kind: ${kind}`);
-  console.log(`\n== fuel_${kind} ==`);
+  log(`\n== fuel_${kind} ==`);
   const meta = await pxGetMeta(parts, lang);
-  await dumpJson(path.join(outDir, `fuel_${kind}_meta.json`), meta);
+  dumpJson(path.join(outDir, `fuel_${kind}_meta.json`), meta);
 
   const dimTime = findTimeDimension(meta);
   let measureDim = null;
@@ -227,10 +263,10 @@ async function inspectFuel(kind, months, outDir, lang) {
       break;
     }
   }
-  console.log('time dim:', dimTime);
-  console.log('measure dim:', measureDim);
+  log('time dim:', dimTime);
+  log('measure dim:', measureDim);
   const measurePairs = metaValueMap(meta, measureDim);
-  console.log('measure labels:', measurePairs.map(([, text]) => text));
+  log('measure labels:', measurePairs.map(([, text]) => text));
 
   const allMonths = metaTimeCodes(meta, dimTime);
   const pick = months ? allMonths.slice(-months) : allMonths;
@@ -241,19 +277,19 @@ async function inspectFuel(kind, months, outDir, lang) {
     ],
     response: { format: 'JSON' },
   };
-  await dumpJson(path.join(outDir, `fuel_${kind}_body.json`), body);
+  dumpJson(path.join(outDir, `fuel_${kind}_body.json`), body);
   const cube = await pxPostData(parts, body, lang);
-  await dumpJson(path.join(outDir, `fuel_${kind}_raw.json`), cube);
-}
+  dumpJson(path.join(outDir, `fuel_${kind}_raw.json`), cube);
+});
 
-async function inspectTourism(tag, months, outDir, lang) {
+const inspectTourism = buffered(async (log, tag, months, outDir, lang) => {
   const parts = TOURISM_TABLES[tag];
   if (!parts) throw new PxError(`Unknown tourism tag: ${tag}`);
-  console.log(`\n== ${tag} ==`);
+  log(`\n== ${tag} ==`);
   const meta = await pxGetMeta(parts, lang);
-  await dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
+  dumpJson(path.join(outDir, `${tag}_meta.json`), meta);
   const dimTime = findTimeDimension(meta);
-  console.log('time dim:', dimTime);
+  log('time dim:', dimTime);
   const allMonths = metaTimeCodes(meta, dimTime);
   const pick = months ? allMonths.slice(-months) : allMonths;
   const query = (meta?.variables ?? []).map((v) => ({
@@ -264,11 +300,11 @@ async function inspectTourism(tag, months, outDir, lang) {
     },
   }));
   const body = { query, response: { format: 'JSON' } };
-  await dumpJson(path.join(outDir, `${tag}_body.json`), body);
+  dumpJson(path.join(outDir, `${tag}_body.json`), body);
   const cube = await pxPostData(parts, body, lang);
-  await dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
-  console.log(`fetched ${pick.length} periods`);
-}
+  dumpJson(path.join(outDir, `${tag}_raw.json`), cube);
+  log(`fetched ${pick.length} periods`);
+});
 
 async function main() {
   const argv = process.argv.slice(2);
@@ -303,15 +339,22 @@ async function main() {
   await fs.mkdir(outDir, { recursive: true });
   const months = args.months ?? null;
   const lang = args.lang ?? 'en';
-  await inspectTrade(months, outDir, lang);
-  await inspectEnergy(months, outDir, lang);
-  await inspectPartners(months, outDir, lang, args.partners ?? ['ALL']);
+  // The inspections are independent round trips to one host; run them
+  // concurrently like the fetch script does. Buffered per-table logging
+  // keeps each table's output contiguous regardless of completion order.
+  const tasks = [
+    inspectTrade(months, outDir, lang),
+    inspectEnergy(months, outDir, lang),
+    inspectPartners(months, outDir, lang, args.partners ?? ['ALL']),
+  ];
   if (args.fuel) {
-    await inspectFuel(args.fuel, months, outDir, lang);
+    tasks.push(inspectFuel(args.fuel, months, outDir, lang));
   }
   if (args.tourism) {
-    await inspectTourism(args.tourism, months, outDir, lang);
+    tasks.push(inspectTourism(args.tourism, months, outDir, lang));
   }
+  await Promise.all(tasks);
+  await flushDumps();
 }
 
 const isDirect = process.argv[1] ? pathToFileURL(process.argv[1]).href === import.meta.url : false;